@@ -14,9 +14,9 @@ import helium as h
 from selenium.common.exceptions import NoSuchElementException
 import pathlib
 
-pd.set_option("max_rows",100)
+pd.set_option("display.max_rows",100)
 #pd.set_option("display.max_columns",100)
-pd.set_option("max_colwidth",1000)
+pd.set_option("display.max_colwidth",1000)
 
 def get_info(df,cod_gr):                               
 
@@ -126,6 +126,9 @@ def clean_df(df):
     dfc=df[c]
     return dfc
 
+# presentation sheet data, downloaded once per export and shared by every group workbook
+TEMPLATE_URL='https://github.com/restrepo/InstituLAC/raw/main/data/template_data.xlsx'
+
 def clean_tables(df):
     #droplevel
     try:
@@ -413,7 +416,7 @@ def format_info(df, writer, sheet_name):
     worksheet.set_column('F14:F14',30, normal)
 
 # WORKSHEET 1
-def format_ptt(workbook):
+def format_ptt(workbook,datos):
     
     #Global variables
     abstract_text='VERIFICACIÓN DE INFORMACIÓN PARA OTORGAR AVAL A LOS GRUPOS DE INVESTIGACIÓN  E INVESTIGADORES PARA SU PARTICIPACIÓN EN LA CONVOCATORIA 894 DE 2021 DE MINCIENCIAS'
@@ -429,9 +432,6 @@ def format_ptt(workbook):
 
     De antemano, la Vicerrectoría de Investigación agradece su participación en este ejercicio, que resulta de vital importancia para llevar a buen término la Convocatoria de Reconocimiento y Medición de Grupos de Investigación
     '''
-    #Final part of the first sheet
-    datos=clean_df(pd.read_excel('https://github.com/restrepo/InstituLAC/raw/main/data/template_data.xlsx'))
-
     #Capture xlsxwriter object 
     # IMPORTANT → workbook is the same object used in the official document at https://xlsxwriter.readthedocs.io
     #workbook=writer.book
@@ -564,6 +564,14 @@ def login(user,password,institution='UNIVERSIDAD DE ANTIOQUIA',sleep=0.8,headles
     h.select(browser.find_element_by_xpath('//table[@id="grupos_avalados"]//select[@name="maxRows"]'),'100')
     return browser
 
+# resolved href of every node matching the XPath in arguments[0]
+HREFS_JS='''
+var r=document.evaluate(arguments[0],document,null,XPathResult.ORDERED_NODE_SNAPSHOT_TYPE,null);
+var hrefs=[];
+for(var i=0;i<r.snapshotLength;i++){hrefs.push(r.snapshotItem(i).href);}
+return hrefs;
+'''
+
 def get_groups(browser,DIR='InstituLAC',sleep=0.8):
     # catch 1: groups info [name, lider, cod,  link to producs]  
     # schema
@@ -600,8 +608,8 @@ def get_groups(browser,DIR='InstituLAC',sleep=0.8):
             dfgp=df[c][1:-1]
             print(dfgp.columns,dfgp.shape)
 
-            # catch urls
-            url=[a.get_attribute('href') for a in browser.find_elements_by_xpath('//table[@id="grupos_avalados"]//td[5]/a')]
+            # catch urls (all hrefs in one WebDriver call instead of one per link)
+            url=browser.execute_script(HREFS_JS,'//table[@id="grupos_avalados"]//td[5]/a')
             dfgp['Revisar'] = url
             dfg=dfg.append(dfgp)
 
@@ -725,7 +733,7 @@ def get_DB(browser,DB=[],dfg=pd.DataFrame(),sleep=0.8,DIR='InstituLAC',
             page_source = browser.page_source
             # detect tables
             try:
-                tables = pd.read_html(browser.page_source,attrs={'class':'table'})
+                tables = pd.read_html(page_source,attrs={'class':'table'})
             # clean tables
             except (ValueError, ImportError) as e:
                 tables = [None]
@@ -759,6 +767,7 @@ def to_excel(DB,dfg,DIR='InstituLAC'):
     global general
     global writer
     global workbook
+    datos=clean_df(pd.read_excel(TEMPLATE_URL))
     # ONE GROUP IMPLEMENTATION
     for idxx in range(len(DB)):
     # DATA
@@ -784,7 +793,7 @@ def to_excel(DB,dfg,DIR='InstituLAC'):
         general=workbook.add_format({'text_wrap':True})
 
         # PPT
-        format_ptt(workbook)
+        format_ptt(workbook,datos)
 
         # INFO GROUP
         df=get_info(DBG['Info_group'], col_gr)
@@ -1686,20 +1695,17 @@ def to_json(DB,dfg,DIR='InstituLAC'):
         
     return DBJ
 
+def check_range(start,end):
+    'exit if the requested end group comes before start'
+    if end and start and end < start:
+        sys.exit('ERROR! end<start')
+
 def main(user, password, institution='UNIVERSIDAD DE ANTIOQUIA', DIR='InstituLAC', 
          CHECKPOINT=True,headless=True, start=None, end=None, COL_Group='',
          start_time=0):
     '''
     '''
-    browser = login(user, password, institution=institution, headless=headless)
-    
-    LOGIN=True
-    if not browser:
-        LOGIN=False
-        return LOGIN
-        
-    time.sleep(2)
-
+    # checkpoint and range checks do not need the browser: fail before login
     DB, dfg, start, CHECKPOINT = checkpoint(DIR=DIR, start=start, CHECKPOINT=CHECKPOINT)
     print('*' * 80)
     if CHECKPOINT:
@@ -1708,11 +1714,24 @@ def main(user, password, institution='UNIVERSIDAD DE ANTIOQUIA', DIR='InstituLAC
         print(f'start → {start}')
     print('*' * 80)
     
-    if end and start and end < start:
-        sys.exit('ERROR! end<=start')
+    LOGIN=True
+    # every requested group is already in the checkpoint, even past end: skip
+    # the browser (before check_range, which would reject start > end)
+    if CHECKPOINT and not COL_Group and start >= (len(dfg) if end is None else min(end, len(dfg))):
+        print('all groups already downloaded')
+    else:
+        check_range(start, end)
+
+        browser = login(user, password, institution=institution, headless=headless)
+
+        if not browser:
+            LOGIN=False
+            return LOGIN
+
+        time.sleep(2)
 
-    DB, dfg = get_DB(browser, DB=DB, dfg=dfg, DIR=DIR,
-                     start=start, end=end, COL_Group=COL_Group, start_time=start_time)
+        DB, dfg = get_DB(browser, DB=DB, dfg=dfg, DIR=DIR,
+                         start=start, end=end, COL_Group=COL_Group, start_time=start_time)
 
     DB, nones = dummy_fix_df(DB)
     if nones:
@@ -88,6 +88,9 @@ def executor():
             print('=' * 80)
             print(f'try {n}/{max_tries}')
             print('=' * 80)
+            # back off before logging in again to not hammer InstituLAC
+            if n < max_tries - 1:
+                time.sleep(min(2**n, 60))
 
     return redirect(url_for('index'))
 
@@ -0,0 +1,70 @@
+import unittest
+from unittest import mock
+
+import pandas as pd
+
+from chibchas import tools
+
+
+class TestMainCheckpoint(unittest.TestCase):
+    def setUp(self):
+        self.dfg = pd.DataFrame({'COL Grupo': ['COL001', 'COL002']})
+        self.DB = [{'Info_group': pd.DataFrame(), 'Members': pd.DataFrame()}] * 2
+        patches = [mock.patch.object(tools, 'login', return_value=mock.Mock()),
+                   mock.patch.object(tools, 'get_DB', return_value=(self.DB, self.dfg)),
+                   mock.patch.object(tools, 'to_excel'),
+                   mock.patch.object(tools, 'to_json'),
+                   mock.patch.object(tools.time, 'sleep')]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+
+    def run_main(self, start, end=None):
+        with mock.patch.object(tools, 'checkpoint',
+                               return_value=(self.DB, self.dfg, start, True)):
+            return tools.main('user', 'password', end=end)
+
+    def test_skip_login_when_checkpoint_covers_range(self):
+        self.assertTrue(self.run_main(start=2))
+        tools.login.assert_not_called()
+        tools.to_excel.assert_called_once()
+
+    def test_skip_login_when_checkpoint_reaches_end(self):
+        self.assertTrue(self.run_main(start=1, end=1))
+        tools.login.assert_not_called()
+
+    def test_login_when_groups_are_missing(self):
+        self.assertTrue(self.run_main(start=1))
+        tools.login.assert_called_once()
+        tools.get_DB.assert_called_once()
+
+    def test_skip_login_when_checkpoint_is_past_end(self):
+        self.assertTrue(self.run_main(start=2, end=1))
+        tools.login.assert_not_called()
+        tools.to_excel.assert_called_once()
+
+    def test_bad_range_without_checkpoint_exits(self):
+        with mock.patch.object(tools, 'checkpoint',
+                               return_value=([], pd.DataFrame(), 3, False)):
+            with self.assertRaises(SystemExit):
+                tools.main('user', 'password', start=3, end=2)
+        tools.login.assert_not_called()
+
+    def test_end_zero_is_an_empty_range(self):
+        self.run_main(start=0, end=0)
+        tools.login.assert_not_called()
+
+
+class TestCheckRange(unittest.TestCase):
+    def test_end_before_start_exits(self):
+        with self.assertRaises(SystemExit) as cm:
+            tools.check_range(3, 2)
+        self.assertEqual(str(cm.exception), 'ERROR! end<start')
+
+    def test_valid_range(self):
+        tools.check_range(2, 3)
+        tools.check_range(0, None)
+
+
+if __name__ == '__main__':
+    unittest.main()